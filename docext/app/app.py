@@ -220,6 +220,7 @@ def gradio_app(
         if model_name.startswith("hosted_vllm/")
         else hosted_model_url
     )
+    config.set("VLM_MODEL_URL", os.environ["VLM_MODEL_URL"])
 
     with gr.Blocks() as demo:
         with gr.Tabs():
@@ -1,17 +1,189 @@
 """
-Synchronous API client for vision-language model requests.
+API client for vision-language model requests.
 
-This module provides a synchronous client for making API requests to VLM models
-with improved error handling and configuration management.
+This module provides synchronous and asynchronous clients for making API
+requests to VLM models with improved error handling and configuration management.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import copy
+import hashlib
+import json
 import os
+import threading
+from functools import lru_cache
+
+import httpx
 import requests
+from cachetools import TTLCache
+from cachetools.func import ttl_cache
+from litellm import acompletion
 from litellm import completion
 from loguru import logger
-from .config import config
+from .config import config_snapshot
+
+
+# Keep-alive pool for the direct calls this module makes to the VLM server
+# (model listings). Completions go through litellm, which pools its own
+# connections per provider, so litellm's global state is left alone.
+_HTTP_CLIENT = httpx.Client(
+    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+    timeout=httpx.Timeout(10.0),
+)
+atexit.register(_HTTP_CLIENT.close)
+
+# Requests run with temperature=0, so identical prompts give identical answers.
+# Keep recent responses around to avoid paying for the same VLM call twice.
+_RESPONSE_CACHE: TTLCache[str, dict] | None = (
+    TTLCache(
+        maxsize=config_snapshot.RESPONSE_CACHE_SIZE,
+        ttl=config_snapshot.RESPONSE_CACHE_TTL,
+    )
+    if config_snapshot.RESPONSE_CACHE_SIZE > 0
+    else None
+)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(
+    messages: list[dict],
+    model_name: str,
+    max_tokens: int,
+    num_completions: int,
+    format: dict | None,
+) -> str | None:
+    """Hash the request into a cache key, or return None if it must not be cached."""
+    # max_tokens=1 is only used for availability probes
+    if _RESPONSE_CACHE is None or max_tokens == 1:
+        return None
+    # The server URL is part of the key: config.set("VLM_MODEL_URL", ...) can
+    # point the same model name at a different server
+    payload = json.dumps(
+        [
+            messages,
+            model_name,
+            config_snapshot.VLM_MODEL_URL,
+            max_tokens,
+            num_completions,
+            format,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_cached_response(key: str | None) -> dict | None:
+    if key is None or _RESPONSE_CACHE is None:
+        return None
+    with _RESPONSE_CACHE_LOCK:
+        response = _RESPONSE_CACHE.get(key)
+    if response is not None:
+        logger.debug("Serving response from cache")
+        return copy.deepcopy(response)
+    return None
+
+
+def _cache_response(key: str | None, response: dict) -> None:
+    if key is None or _RESPONSE_CACHE is None:
+        return
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = copy.deepcopy(response)
+
+
+@lru_cache(maxsize=64)
+def _route(model_name: str) -> tuple[bool, bool, bool, bool]:
+    """
+    Classify a model name once.
+    
+    Returns:
+        tuple: (is_hosted_vllm, is_ollama, is_openrouter, is_gpt)
+    """
+    return (
+        model_name.startswith("hosted_vllm/"),
+        model_name.startswith("ollama/"),
+        model_name.startswith("openrouter"),
+        "gpt" in model_name.lower(),
+    )
+
+
+def _build_completion_args(
+    messages: list[dict],
+    model_name: str,
+    max_tokens: int,
+    num_completions: int,
+    format: dict | None,
+) -> dict:
+    """
+    Build the litellm completion arguments for a request.
+
+    Raises:
+        ValueError: If required configuration is missing
+    """
+    # Get VLM URL from config
+    vlm_url = config_snapshot.VLM_MODEL_URL or ""
+    is_hosted_vllm, is_ollama, is_openrouter, is_gpt = _route(model_name)
+    uses_vlm_server = is_hosted_vllm or is_ollama
+
+    # Only require VLM_MODEL_URL for hosted_vllm and ollama models
+    if uses_vlm_server and not vlm_url:
+        raise ValueError(
+            f"VLM_MODEL_URL environment variable is required for model '{model_name}'. "
+            "Please set it to the URL of your VLM/OLLAMA server (e.g., 'http://localhost:8000')."
+        )
+
+    logger.debug("Making request to model '{}' at '{}'", model_name, vlm_url)
+
+    completion_args = {
+        "model": model_name,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "n": num_completions,
+        "temperature": 0,
+        "api_base": vlm_url if uses_vlm_server else None,
+    }
+
+    if uses_vlm_server:
+        completion_args["api_key"] = config_snapshot.API_KEY or "EMPTY"
+
+    # Only add format argument for Ollama models
+    if is_ollama and format:
+        completion_args["format"] = format
+    # elif model_name.startswith("hosted_vllm/") and format: # TODO: Add this back, currently not working in colab
+    #     completion_args["guided_json"] = format
+    #     if "qwen" in model_name.lower():
+    #         completion_args["guided_backend"] = "xgrammar:disable-any-whitespace"
+    elif is_openrouter:
+        completion_args["response_format"] = format
+    elif is_gpt:
+        # Only set response_format if the prompt mentions "json"
+        if any("json" in m.get("text", "").lower() for m in messages if isinstance(m, dict)):
+            completion_args["response_format"] = {"type": "json_object"}
+
+    # messages can carry megabytes of base64 images, so only build the
+    # masked copy when debug records are actually emitted
+    logger.opt(lazy=True).debug(
+        "Request parameters: {}", lambda: _safe_log_params(completion_args)
+    )
+    return completion_args
+
+
+def _translate_request_error(e: Exception, model_name: str) -> Exception:
+    """Map a litellm failure onto the exception surfaced to callers."""
+    logger.error(f"Error making request to model '{model_name}': {str(e)}")
+    if "Connection refused" in str(e) or "Connection error" in str(e):
+        return requests.RequestException(
+            f"Could not connect to model server at {config_snapshot.VLM_MODEL_URL or ''}. "
+            "Please ensure the server is running and accessible."
+        )
+    elif "Unauthorized" in str(e) or "401" in str(e):
+        return requests.RequestException(
+            "Authentication failed. Please check your API_KEY configuration."
+        )
+    return e
 
 
 def sync_request(
@@ -38,83 +210,146 @@ def sync_request(
         ValueError: If required configuration is missing
         requests.RequestException: If API request fails
     """
+    cache_key = _cache_key(messages, model_name, max_tokens, num_completions, format)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Get VLM URL from config
-        vlm_url = config.get("VLM_MODEL_URL", "")
-        
-        # Only require VLM_MODEL_URL for hosted_vllm and ollama models
-        if (model_name.startswith("hosted_vllm/") or model_name.startswith("ollama/")) and not vlm_url:
-            raise ValueError(
-                f"VLM_MODEL_URL environment variable is required for model '{model_name}'. "
-                "Please set it to the URL of your VLM/OLLAMA server (e.g., 'http://localhost:8000')."
-            )
-        
-        logger.debug(f"Making request to model '{model_name}' at '{vlm_url}'")
-        
-        completion_args = {
-            "model": model_name,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "n": num_completions,
-            "temperature": 0,
-            "api_base": vlm_url
-            if model_name.startswith("hosted_vllm/") or model_name.startswith("ollama/")
-            else None,
-        }
-
-        if model_name.startswith("hosted_vllm/") or model_name.startswith("ollama/"):
-            completion_args["api_key"] = config.get("API_KEY", "EMPTY")
-
-        # Only add format argument for Ollama models
-        if model_name.startswith("ollama/") and format:
-            completion_args["format"] = format
-        # elif model_name.startswith("hosted_vllm/") and format: # TODO: Add this back, currently not working in colab
-        #     completion_args["guided_json"] = format
-        #     if "qwen" in model_name.lower():
-        #         completion_args["guided_backend"] = "xgrammar:disable-any-whitespace"
-        elif model_name.startswith("openrouter"):
-            completion_args["response_format"] = format
-        elif "gpt" in model_name.lower():
-            # Only set response_format if the prompt mentions "json"
-            if any("json" in m.get("text", "").lower() for m in messages if isinstance(m, dict)):
-                completion_args["response_format"] = {"type": "json_object"}
-
-        logger.debug(f"Request parameters: {_safe_log_params(completion_args)}")
-        
+        completion_args = _build_completion_args(
+            messages, model_name, max_tokens, num_completions, format
+        )
         response = completion(**completion_args)
         logger.debug("Request successful")
-        return response.json()
+        response_json = response.json()
+        _cache_response(cache_key, response_json)
+        return response_json
         
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         raise
         
     except Exception as e:
-        logger.error(f"Error making request to model '{model_name}': {str(e)}")
-        if "Connection refused" in str(e) or "Connection error" in str(e):
-            raise requests.RequestException(
-                f"Could not connect to model server at {vlm_url}. "
-                "Please ensure the server is running and accessible."
-            )
-        elif "Unauthorized" in str(e) or "401" in str(e):
-            raise requests.RequestException(
-                "Authentication failed. Please check your API_KEY configuration."
-            )
+        error = _translate_request_error(e, model_name)
+        if error is e:
+            raise
+        raise error
+
+
+async def async_request(
+    messages: list[dict],
+    model_name: str = "hosted_vllm/nanonets/Nanonets-OCR-s",
+    max_tokens: int = 5000,
+    num_completions: int = 1,
+    format: dict | None = None,
+):
+    """
+    Make an asynchronous request to the VLM model.
+
+    Takes the same arguments and raises the same errors as `sync_request`, but
+    awaits `litellm.acompletion` so independent requests can run concurrently.
+
+    Returns:
+        JSON response from the model
+    """
+    # Hashing the image payloads is CPU bound, so keep it off the event loop
+    cache_key = await asyncio.to_thread(
+        _cache_key, messages, model_name, max_tokens, num_completions, format
+    )
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        completion_args = _build_completion_args(
+            messages, model_name, max_tokens, num_completions, format
+        )
+        response = await acompletion(**completion_args)
+        logger.debug("Request successful")
+        response_json = response.json()
+        _cache_response(cache_key, response_json)
+        return response_json
+
+    except ValueError as e:
+        logger.error(f"Configuration error: {e}")
         raise
 
+    except Exception as e:
+        error = _translate_request_error(e, model_name)
+        if error is e:
+            raise
+        raise error
+
+
+class _SafeParams:
+    """
+    Logging view of request parameters.
+    
+    Nothing is copied up front; when rendered, the API key is masked and the
+    messages (which carry base64 images) are summarised by count.
+    """
+    
+    __slots__ = ("_params",)
+    
+    def __init__(self, params: dict):
+        self._params = params
+    
+    def __repr__(self) -> str:
+        shown = {key: value for key, value in self._params.items() if key != 'messages'}
+        if 'api_key' in shown:
+            shown['api_key'] = '***masked***'
+        if 'messages' in self._params:
+            shown['messages'] = f"<{len(self._params['messages'])} messages>"
+        return repr(shown)
+    
+    __str__ = __repr__
+
+
+def _safe_log_params(params: dict) -> _SafeParams:
+    """Create a safe view of parameters for logging (mask sensitive data)."""
+    return _SafeParams(params)
 
-def _safe_log_params(params: dict) -> dict:
-    """Create a safe version of parameters for logging (mask sensitive data)."""
-    safe_params = params.copy()
-    if 'api_key' in safe_params:
-        safe_params['api_key'] = '***masked***'
-    return safe_params
 
+def _list_served_models(model_name: str) -> list[str] | None:
+    """
+    List the models served by our own vLLM/OLLAMA server.
+    
+    Uses the server's model listing endpoint, which is much cheaper than a
+    generation request. Returns None for models not served by our own server.
+    
+    Raises:
+        ValueError: If VLM_MODEL_URL is not configured
+        httpx.HTTPError: If the server cannot be reached
+    """
+    is_hosted_vllm, is_ollama, _, _ = _route(model_name)
+    if not (is_hosted_vllm or is_ollama):
+        return None
+    
+    vlm_url = (config_snapshot.VLM_MODEL_URL or "").rstrip("/")
+    if not vlm_url:
+        raise ValueError(f"VLM_MODEL_URL is required for model '{model_name}'")
+    
+    if is_hosted_vllm:
+        url = f"{vlm_url}/models" if vlm_url.endswith("/v1") else f"{vlm_url}/v1/models"
+        headers = {"Authorization": f"Bearer {config_snapshot.API_KEY or 'EMPTY'}"}
+        response = _HTTP_CLIENT.get(url, headers=headers, timeout=10.0)
+        response.raise_for_status()
+        return [model["id"] for model in response.json().get("data", [])]
+    
+    response = _HTTP_CLIENT.get(f"{vlm_url}/api/tags", timeout=10.0)
+    response.raise_for_status()
+    return [model["name"] for model in response.json().get("models", [])]
 
+
+@ttl_cache(maxsize=16, ttl=30)
 def check_model_availability(model_name: str) -> bool:
     """
     Check if a model is available and accessible.
     
+    Self-hosted (vLLM/OLLAMA) models are looked up in the server's model
+    listing; other models get a one-token test request. Results are cached
+    for 30 seconds.
+    
     Args:
         model_name: Name of the model to check
         
@@ -122,9 +357,15 @@ def check_model_availability(model_name: str) -> bool:
         bool: True if model is available, False otherwise
     """
     try:
-        # Make a simple test request
-        test_messages = [{"role": "user", "content": "Hello"}]
-        sync_request(test_messages, model_name, max_tokens=1)
+        served_models = _list_served_models(model_name)
+        if served_models is None:
+            # Make a simple test request
+            test_messages = [{"role": "user", "content": "Hello"}]
+            sync_request(test_messages, model_name, max_tokens=1)
+        else:
+            served_name = model_name.split("/", 1)[1]
+            if served_name not in served_models and f"{served_name}:latest" not in served_models:
+                raise ValueError(f"server does not serve '{served_name}'")
         logger.info(f"Model {model_name} is available")
         return True
         
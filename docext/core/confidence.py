@@ -5,9 +5,14 @@ def get_fields_confidence_score_messages_binary(
     messages: list[dict],
     assistant_response: str,
     fields: list[str],
+    num_documents: int = 1,
 ) -> list[dict]:
     messages.append({"role": "assistant", "content": assistant_response})
-    output_format = {field: "High/Low" for field in fields}
+    document_format = {field: "High/Low" for field in fields}
+    output_format: dict[str, str] | list[dict[str, str]] = document_format
+    if num_documents > 1:
+        # one object per document, in the same order as the answer
+        output_format = [document_format] * num_documents
     messages.append(
         {
             "role": "user",
@@ -21,9 +26,14 @@ def get_fields_confidence_score_messages_numeric(
     messages: list[dict],
     assistant_response: str,
     fields: list[str],
+    num_documents: int = 1,
 ) -> list[dict]:
     messages.append({"role": "assistant", "content": assistant_response})
-    output_format = {field: "0-100" for field in fields}
+    document_format = {field: "0-100" for field in fields}
+    output_format: dict[str, str] | list[dict[str, str]] = document_format
+    if num_documents > 1:
+        # one object per document, in the same order as the answer
+        output_format = [document_format] * num_documents
     messages.append(
         {
             "role": "user",
@@ -11,7 +11,9 @@ This module provides centralized configuration management including:
 from __future__ import annotations
 
 import os
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional, Sequence, Union
 from loguru import logger
 
 
@@ -23,6 +25,8 @@ class ConfigManager:
         self._config = {}
         self._load_environment_variables()
         self._validate_required_settings()
+        # Attribute view of the configuration for hot paths, kept in sync by set()
+        self.snapshot = SimpleNamespace(**self._config)
     
     def _load_environment_variables(self):
         """Load and validate environment variables."""
@@ -37,6 +41,11 @@ class ConfigManager:
         # Model settings
         self._config['DEFAULT_MODEL'] = os.getenv('DEFAULT_MODEL', 'gpt-4o')
         self._config['MAX_IMAGE_SIZE'] = int(os.getenv('MAX_IMAGE_SIZE', '1024'))
+        self._config['JPEG_QUALITY'] = int(os.getenv('JPEG_QUALITY', '85'))
+        
+        # Response cache settings (set RESPONSE_CACHE_SIZE=0 to disable)
+        self._config['RESPONSE_CACHE_SIZE'] = int(os.getenv('RESPONSE_CACHE_SIZE', '512'))
+        self._config['RESPONSE_CACHE_TTL'] = int(os.getenv('RESPONSE_CACHE_TTL', '600'))
         
         # Logging configuration
         self._config['LOG_LEVEL'] = os.getenv('LOG_LEVEL', 'INFO')
@@ -44,6 +53,7 @@ class ConfigManager:
         # Application settings
         self._config['TEMP_DIR'] = os.getenv('TEMP_DIR', os.path.join(os.getcwd(), 'temp'))
         self._config['CLEANUP_TEMP_FILES'] = os.getenv('CLEANUP_TEMP_FILES', 'true').lower() == 'true'
+        self._config['ATEXIT_CLEANUP'] = os.getenv('DOCEXT_ATEXIT_CLEANUP', 'false').lower() == 'true'
         
         logger.debug(f"Loaded configuration: {self._get_safe_config()}")
     
@@ -77,6 +87,7 @@ class ConfigManager:
     def set(self, key: str, value: Any):
         """Set configuration value."""
         self._config[key] = value
+        setattr(self.snapshot, key, value)
     
     def get_required(self, key: str) -> Any:
         """Get required configuration value, raise error if missing."""
@@ -90,8 +101,35 @@ class ConfigManager:
         return bool(self._config.get('VLM_MODEL_URL'))
 
 
+@dataclass(frozen=True, slots=True)
+class Field:
+    """A field or table column to extract."""
+    
+    name: str
+    description: str = ""
+    type: str = "field"
+    
+    @classmethod
+    def from_dict(cls, details: Dict[str, Any], default_type: str = "field") -> "Field":
+        """Build a Field from a `{'name', 'description', 'type'}` dict."""
+        return cls(
+            name=details["name"],
+            description=details.get("description", ""),
+            type=details.get("type", default_type),
+        )
+
+
+def as_fields(items: Sequence[Union[Field, Dict[str, Any]]], default_type: str = "field") -> List[Field]:
+    """Normalize a list of Field objects and/or field dicts to Field objects."""
+    return [
+        item if isinstance(item, Field) else Field.from_dict(item, default_type)
+        for item in items
+    ]
+
+
 # Global configuration instance
 config = ConfigManager()
+config_snapshot = config.snapshot
 
 
 TEMPLATES_FIELDS = {
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import atexit
+import io
+import re
+import threading
+from collections.abc import Sequence
 from typing import Dict
 from typing import Union
 
 import json_repair
 import mdpd
+import numpy as np
+import orjson
 import pandas as pd
 from loguru import logger
+from PIL import Image
 
-from docext.core.client import sync_request
+from docext.core.client import async_request
+from docext.core.config import Field
+from docext.core.config import as_fields
+from docext.core.config import config
 from docext.core.confidence import get_fields_confidence_score_messages_binary
 from docext.core.prompts import get_fields_messages
+from docext.core.prompts import get_fields_messages_batched
 from docext.core.prompts import get_tables_messages
+from docext.core.utils import convert_files_to_image_bytes
 from docext.core.utils import convert_files_to_images
 from docext.core.utils import resize_images
 from docext.core.utils import validate_fields_and_tables
@@ -20,117 +33,355 @@ from docext.core.utils import validate_file_paths
 
 
 def extract_fields_from_documents(
-    file_paths: list[str],
+    file_paths: list[str | bytes],
     model_name: str,
-    fields: list[dict],
+    fields: Sequence[Field | dict],
+    batch_size: int | None = None,
+    max_batch_pixels: int | None = None,
 ):
     """
     Extract specified fields from documents using a vision-language model.
+
+    Synchronous wrapper around `aextract_fields_from_documents`.
+    """
+    return _run(
+        aextract_fields_from_documents(
+            file_paths, model_name, fields, batch_size, max_batch_pixels
+        )
+    )
+
+
+# One long-lived event loop shared by all extraction calls, instead of
+# creating and tearing down a loop (and its executor) on every call. Only
+# network I/O should run on it: CPU-bound steps such as image encoding go
+# through asyncio.to_thread so concurrent callers aren't serialized
+_EXTRACT_LOOP: asyncio.AbstractEventLoop | None = None
+_EXTRACT_LOOP_LOCK = threading.Lock()
+
+
+def _get_extract_loop() -> asyncio.AbstractEventLoop:
+    global _EXTRACT_LOOP
+    with _EXTRACT_LOOP_LOCK:
+        if _EXTRACT_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="docext-extract",
+                daemon=True,
+            ).start()
+            atexit.register(loop.call_soon_threadsafe, loop.stop)
+            _EXTRACT_LOOP = loop
+    return _EXTRACT_LOOP
+
+
+def _run(coroutine):
+    """
+    Run a coroutine to completion on the shared extraction loop.
+    
+    Works from any thread, including ones that already run their own event
+    loop (e.g. notebooks), where asyncio.run would fail.
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_extract_loop()).result()
+
+
+_MD_TABLE_SEPARATOR_CELL = re.compile(r":?-+:?")
+# A markdown table row; "$" under re.M only matches before "\n", so CRLF is
+# normalized before searching
+_MD_TABLE_ROW = re.compile(r"^[ \t]*\|.*$", re.M)
+
+
+def _find_md_table(response: str) -> str | None:
+    """
+    Cut the markdown table out of a model response.
+    
+    Spans from the first to the last table row, so blank or stray lines
+    inside the table don't cut it short; the parsers skip them.
+    """
+    response = response.replace("\r\n", "\n")
+    rows = list(_MD_TABLE_ROW.finditer(response))
+    if not rows:
+        return None
+    return response[rows[0].start():rows[-1].end()]
+
+
+def _parse_md_table(table_md: str) -> pd.DataFrame:
+    """
+    Parse a well-formed markdown table (header, separator row, body).
     
-    Args:
-        file_paths: List of paths to document files
-        model_name: Name of the VLM model to use
-        fields: List of field dictionaries with 'name' and optional 'description'
-        
-    Returns:
-        pandas.DataFrame: Extracted fields with confidence scores
-        
     Raises:
-        ValueError: If fields list is invalid
-        Exception: If extraction fails
+        ValueError: If the table is not well-formed
     """
-    if len(fields) == 0:
-        logger.warning("No fields specified for extraction")
-        return pd.DataFrame()
-        
+    rows = []
+    for line in table_md.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if not (line.startswith("|") and line.endswith("|")) or len(line) < 2:
+            raise ValueError(f"Unexpected line in markdown table: {line}")
+        rows.append([cell.strip() for cell in line[1:-1].split("|")])
+
+    if len(rows) < 2 or not all(
+        _MD_TABLE_SEPARATOR_CELL.fullmatch(cell) for cell in rows[1]
+    ):
+        raise ValueError("Markdown table has no header separator row")
+
+    header, body = rows[0], rows[2:]
+    if any(len(row) != len(header) for row in body):
+        raise ValueError("Markdown table rows do not match the header")
+    return pd.DataFrame.from_records(body, columns=header)
+
+
+def _md_table_to_df(table_md: str) -> pd.DataFrame:
+    """Convert a markdown table, leaving malformed ones to the more tolerant mdpd."""
     try:
-        field_names = [field["name"] for field in fields]
-        fields_description = [field.get("description", "") for field in fields]
-        
-        logger.debug(f"Extracting fields: {field_names}")
-        messages = get_fields_messages(field_names, fields_description, file_paths)
+        return _parse_md_table(table_md)
+    except ValueError:
+        return mdpd.from_md(table_md)
+
+
+def _loads_json(text: str):
+    """Parse model JSON output, only repairing it when strict parsing fails."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json_repair.loads(text)
+
+
+def _image_pixels(image: str | bytes) -> int:
+    """Pixel count of an image path or encoded image, read from its header."""
+    with Image.open(io.BytesIO(image) if isinstance(image, bytes) else image) as img:
+        return img.size[0] * img.size[1]
+
+
+def _batch_documents(
+    images: list[str | bytes],
+    batch_size: int,
+    max_batch_pixels: int | None = None,
+) -> list[list[str | bytes]]:
+    """Group single-image documents into request batches."""
+    batches: list[list[str | bytes]] = []
+    batch: list[str | bytes] = []
+    batch_pixels = 0
+    for image in images:
+        pixels = _image_pixels(image) if max_batch_pixels else 0
+        if batch and (
+            len(batch) >= batch_size
+            or (max_batch_pixels and batch_pixels + pixels > max_batch_pixels)
+        ):
+            batches.append(batch)
+            batch, batch_pixels = [], 0
+        batch.append(image)
+        batch_pixels += pixels
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _has_answers(extracted_fields) -> bool:
+    """Whether a parsed field extraction response holds any non-empty answer."""
+    documents = extracted_fields if isinstance(extracted_fields, list) else [extracted_fields]
+    return any(
+        isinstance(document, dict)
+        and any(value not in ("", None) for value in document.values())
+        for document in documents
+    )
+
+
+async def _aextract_fields_batch(
+    images: list[str | bytes],
+    model_name: str,
+    field_names: list[str],
+    fields_description: list[str],
+    num_documents: int | None = None,
+) -> tuple[list[dict], list[dict]]:
+    """
+    Run the extraction and confidence requests for one prompt.
 
-        format_fields = {
-            "type": "object",
-            "properties": {field_name: {"type": "string"} for field_name in field_names},
-        }
+    With `num_documents=None` all images are pages of a single document,
+    otherwise every image is its own document and one answer is expected per
+    image.
 
-        logger.info(f"Sending field extraction request to {model_name}")
-        response = sync_request(messages, model_name, format=format_fields)["choices"][0][
-            "message"
-        ]["content"]
-        logger.debug(f"Field extraction response: {response}")
+    Returns:
+        tuple: (extracted_fields, conf_scores), one dict per document
+    """
+    format_fields = {
+        "type": "object",
+        "properties": {field_name: {"type": "string"} for field_name in field_names},
+    }
+    format_fields_conf_score = {
+        "type": "object",
+        "properties": {
+            field_name: {"type": "string", "enum": ["High", "Low"]}
+            for field_name in field_names
+        },
+    }
 
+    # Encoding the images is CPU bound, so keep it off the shared loop
+    if num_documents is None:
+        messages = await asyncio.to_thread(
+            get_fields_messages, field_names, fields_description, images
+        )
+    else:
+        messages = await asyncio.to_thread(
+            get_fields_messages_batched, field_names, fields_description, images
+        )
+        format_fields = {"type": "array", "items": format_fields}
+        if num_documents > 1:
+            format_fields_conf_score = {
+                "type": "array",
+                "items": format_fields_conf_score,
+            }
+
+    logger.info(f"Sending field extraction request to {model_name}")
+    response = (await async_request(messages, model_name, format=format_fields))[
+        "choices"
+    ][0]["message"]["content"]
+    logger.debug("Field extraction response: {}", response)
+
+    try:
+        extracted_fields = _loads_json(response)
+    except Exception as e:
+        logger.error(f"Failed to parse extracted fields: {e}")
+        raise ValueError(f"Invalid field extraction response format: {response}")
+
+    # One dict for all documents, or one per document
+    conf_scores: dict | list[dict]
+    if not _has_answers(extracted_fields):
+        # Nothing to score, so skip the confidence round-trip
+        logger.warning("Field extraction returned no answers, skipping confidence scoring")
+        conf_scores = {field: "Low" for field in field_names}
+    else:
         # Get confidence scores
         messages = get_fields_confidence_score_messages_binary(
             messages,
             response,
             field_names,
+            num_documents or 1,
         )
 
-        format_fields_conf_score = {
-            "type": "object",
-            "properties": {
-                field_name: {"type": "string", "enum": ["High", "Low"]}
-                for field_name in field_names
-            },
-        }
-
         logger.info(f"Requesting confidence scores from {model_name}")
-        response_conf_score = sync_request(
-            messages,
-            model_name,
-            format=format_fields_conf_score,
+        response_conf_score = (
+            await async_request(
+                messages,
+                model_name,
+                format=format_fields_conf_score,
+            )
         )["choices"][0]["message"]["content"]
-        logger.debug(f"Confidence score response: {response_conf_score}")
+        logger.debug("Confidence score response: {}", response_conf_score)
 
-        # Parse responses with error handling
-        try:
-            extracted_fields = json_repair.loads(response)
-        except Exception as e:
-            logger.error(f"Failed to parse extracted fields: {e}")
-            raise ValueError(f"Invalid field extraction response format: {response}")
-            
         try:
-            conf_scores = json_repair.loads(response_conf_score)
+            conf_scores = _loads_json(response_conf_score)
         except Exception as e:
             logger.error(f"Failed to parse confidence scores: {e}")
             # Create default confidence scores if parsing fails
             conf_scores = {field: "Low" for field in field_names}
 
-        logger.info(f"Extracted fields: {extracted_fields}")
-        logger.info(f"Confidence scores: {conf_scores}")
+    logger.info(f"Extracted fields: {extracted_fields}")
+    logger.info(f"Confidence scores: {conf_scores}")
+
+    # Handle both single dictionary and list of dictionaries
+    if not isinstance(extracted_fields, list):
+        extracted_fields = [extracted_fields]
+    if num_documents is not None:
+        # Keep one entry per document so document indices stay aligned
+        extracted_fields = extracted_fields[:num_documents]
+        extracted_fields.extend([{}] * (num_documents - len(extracted_fields)))
+    
+    # Handle confidence scores similarly
+    if not isinstance(conf_scores, list):
+        conf_scores = [conf_scores] * len(extracted_fields)
+    elif len(conf_scores) < len(extracted_fields):
+        # If we have fewer confidence scores than documents, pad with the first confidence score
+        conf_scores.extend([conf_scores[0]] * (len(extracted_fields) - len(conf_scores)))
+
+    return extracted_fields, conf_scores
 
-        # Handle both single dictionary and list of dictionaries
-        if not isinstance(extracted_fields, list):
-            extracted_fields = [extracted_fields]
+
+async def aextract_fields_from_documents(
+    file_paths: list[str | bytes],
+    model_name: str,
+    fields: Sequence[Field | dict],
+    batch_size: int | None = None,
+    max_batch_pixels: int | None = None,
+):
+    """
+    Extract specified fields from documents using a vision-language model.
+    
+    Args:
+        file_paths: List of image file paths or encoded image bytes
+        model_name: Name of the VLM model to use
+        fields: List of `Field` records or dicts with 'name' and optional 'description'
+        batch_size: If set, every image is treated as a separate document and
+            up to `batch_size` documents are extracted per request. By default
+            all images are pages of a single document.
+        max_batch_pixels: Optional cap on the total pixels sent in one batch
         
-        # Handle confidence scores similarly
-        if not isinstance(conf_scores, list):
-            conf_scores = [conf_scores] * len(extracted_fields)
-        elif len(conf_scores) < len(extracted_fields):
-            # If we have fewer confidence scores than documents, pad with the first confidence score
-            conf_scores.extend([conf_scores[0]] * (len(extracted_fields) - len(conf_scores)))
+    Returns:
+        pandas.DataFrame: Extracted fields with confidence scores
         
-        # Create a list of dataframes, one for each document
-        dfs = []
-        for idx, (doc_fields, doc_conf_scores) in enumerate(zip(extracted_fields, conf_scores)):
-            df = pd.DataFrame(
-                {
-                    "fields": field_names,
-                    "answer": [doc_fields.get(field, "") for field in field_names],
-                    "confidence": [doc_conf_scores.get(field, "Low") for field in field_names],
-                    "document_index": [idx] * len(field_names)
-                },
-            )
-            dfs.append(df)
+    Raises:
+        ValueError: If fields list is invalid
+        Exception: If extraction fails
+    """
+    if len(fields) == 0:
+        logger.warning("No fields specified for extraction")
+        return pd.DataFrame()
         
-        # Concatenate all dataframes with a document index
-        if dfs:
-            final_df = pd.concat(dfs, ignore_index=True)
+    try:
+        records = as_fields(fields, "field")
+        field_names = [record.name for record in records]
+        fields_description = [record.description for record in records]
+        
+        logger.debug(f"Extracting fields: {field_names}")
+
+        if batch_size is None:
+            batch_results = [
+                await _aextract_fields_batch(
+                    file_paths, model_name, field_names, fields_description
+                )
+            ]
         else:
-            # Return empty DataFrame with correct columns if no data
-            final_df = pd.DataFrame(columns=["fields", "answer", "confidence", "document_index"])
+            batches = await asyncio.to_thread(
+                _batch_documents, file_paths, batch_size, max_batch_pixels
+            )
+            logger.debug(f"Extracting {len(file_paths)} documents in {len(batches)} batches")
+            batch_results = await asyncio.gather(
+                *(
+                    _aextract_fields_batch(
+                        batch, model_name, field_names, fields_description, len(batch)
+                    )
+                    for batch in batches
+                )
+            )
+
+        extracted_fields = []
+        conf_scores = []
+        for batch_fields, batch_conf_scores in batch_results:
+            extracted_fields.extend(batch_fields)
+            conf_scores.extend(batch_conf_scores)
+        
+        # Build the frame column-wise in one go, already ordered by document
+        # and then field name, which is how extract_information presents it
+        ordered_names = sorted(field_names)
+        num_documents = min(len(extracted_fields), len(conf_scores))
+        final_df = pd.DataFrame(
+            {
+                "fields": ordered_names * num_documents,
+                "answer": [
+                    extracted_fields[idx].get(field, "")
+                    for idx in range(num_documents)
+                    for field in ordered_names
+                ],
+                "confidence": pd.Categorical(
+                    [
+                        conf_scores[idx].get(field, "Low")
+                        for idx in range(num_documents)
+                        for field in ordered_names
+                    ]
+                ),
+                "document_index": np.repeat(np.arange(num_documents), len(ordered_names)),
+            },
+        )
         
         return final_df
         
@@ -141,17 +392,30 @@ def extract_fields_from_documents(
 
 
 def extract_tables_from_documents(
-    file_paths: list[str],
+    file_paths: list[str | bytes],
     model_name: str,
-    columns: list[dict],
+    columns: Sequence[Field | dict],
+):
+    """
+    Extract tables from documents using a vision-language model.
+
+    Synchronous wrapper around `aextract_tables_from_documents`.
+    """
+    return _run(aextract_tables_from_documents(file_paths, model_name, columns))
+
+
+async def aextract_tables_from_documents(
+    file_paths: list[str | bytes],
+    model_name: str,
+    columns: Sequence[Field | dict],
 ):
     """
     Extract tables from documents using a vision-language model.
     
     Args:
-        file_paths: List of paths to document files
+        file_paths: List of image file paths or encoded image bytes
         model_name: Name of the VLM model to use
-        columns: List of column dictionaries with 'name', 'type', and optional 'description'
+        columns: List of `Field` records or dicts with 'name', 'type', and optional 'description'
         
     Returns:
         pandas.DataFrame: Extracted table data
@@ -165,36 +429,37 @@ def extract_tables_from_documents(
         return pd.DataFrame()
         
     try:
-        columns_names = [column["name"] for column in columns if column["type"] == "table"]
+        records = [
+            record for record in as_fields(columns, "table") if record.type == "table"
+        ]
+        columns_names = [record.name for record in records]
         if not columns_names:
             logger.warning("No table columns found in columns list")
             return pd.DataFrame()
             
-        columns_description = [
-            column.get("description", "") for column in columns if column["type"] == "table"
-        ]
+        columns_description = [record.description for record in records]
         
         logger.debug(f"Extracting table columns: {columns_names}")
-        messages = get_tables_messages(columns_names, columns_description, file_paths)
+        messages = await asyncio.to_thread(
+            get_tables_messages, columns_names, columns_description, file_paths
+        )
 
         logger.info(f"Sending table extraction request to {model_name}")
-        response = sync_request(messages, model_name)["choices"][0]["message"]["content"]
-        logger.debug(f"Table extraction response: {response}")
+        response = (await async_request(messages, model_name))["choices"][0]["message"][
+            "content"
+        ]
+        logger.debug("Table extraction response: {}", response)
 
         # Extract markdown table from response
         try:
-            if "|" not in response:
+            table_md = _find_md_table(response)
+            if table_md is None:
                 logger.error("No table markers found in response")
                 raise ValueError("Response does not contain a valid markdown table")
-                
-            table_start = response.index("|")
-            table_end = response.rindex("|") + 1
-            table_md = response[table_start:table_end]
             
-            logger.debug(f"Extracted table markdown: {table_md}")
+            logger.debug("Extracted table markdown: {}", table_md)
             
-            # Convert markdown table to DataFrame
-            df = mdpd.from_md(table_md)
+            df = _md_table_to_df(table_md)
             
             if df.empty:
                 logger.warning("Extracted table is empty")
@@ -215,11 +480,52 @@ def extract_tables_from_documents(
         return pd.DataFrame()
 
 
+async def _aextract_fields_and_tables(
+    images: list[str | bytes],
+    model_name: str,
+    fields_and_tables: dict[str, list[Field]],
+    extract_fields: bool,
+    extract_tables: bool,
+    batch_size: int | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Run the fields and tables extraction concurrently on one event loop."""
+
+    async def _empty() -> pd.DataFrame:
+        return pd.DataFrame()
+
+    if extract_fields and extract_tables:
+        logger.debug("Extracting fields and tables concurrently")
+    elif extract_fields:
+        logger.debug("Extracting fields only")
+    else:
+        logger.debug("Extracting tables only")
+
+    fields_df, tables_df = await asyncio.gather(
+        aextract_fields_from_documents(
+            images,
+            model_name,
+            fields_and_tables["fields"],
+            batch_size,
+        )
+        if extract_fields
+        else _empty(),
+        aextract_tables_from_documents(
+            images,
+            model_name,
+            fields_and_tables["tables"],
+        )
+        if extract_tables
+        else _empty(),
+    )
+    return fields_df, tables_df
+
+
 def extract_information(
     file_inputs: list[tuple],
     model_name: str,
     max_img_size: int,
     fields_and_tables: dict[str, list[dict]] | pd.DataFrame,
+    batch_size: int | None = None,
 ):
     """
     Extract information from documents with optimized processing.
@@ -229,6 +535,8 @@ def extract_information(
         model_name: Name of the VLM model to use
         max_img_size: Maximum image size for processing
         fields_and_tables: Fields and tables configuration
+        batch_size: If set, every file/page is a separate document and fields
+            are extracted for up to `batch_size` documents per request
         
     Returns:
         tuple: (fields_df, tables_df) - DataFrames with extracted data
@@ -260,58 +568,33 @@ def extract_information(
         # Validate file paths
         validate_file_paths(file_paths)
         
-        # Convert and resize images
-        file_paths = convert_files_to_images(file_paths)
-        resize_images(file_paths, max_img_size)
+        # Convert and resize images. Converted pages are throwaway when temp
+        # files get cleaned up anyway, so keep them in memory instead of disk.
+        images: list[str | bytes]
+        if config.get("CLEANUP_TEMP_FILES", True):
+            images = list(convert_files_to_image_bytes(file_paths, max_img_size))
+        else:
+            image_paths = convert_files_to_images(file_paths)
+            resize_images(image_paths, max_img_size)
+            images = list(image_paths)
         
         # Determine what to extract
         extract_fields = len(fields_and_tables["fields"]) > 0
         extract_tables = len(fields_and_tables["tables"]) > 0
         
-        fields_df = pd.DataFrame()
-        tables_df = pd.DataFrame()
-        
-        # Use parallel processing if both fields and tables need extraction
-        if extract_fields and extract_tables:
-            logger.debug("Extracting fields and tables in parallel")
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                future_fields = executor.submit(
-                    extract_fields_from_documents,
-                    file_paths,
-                    model_name,
-                    fields_and_tables["fields"],
-                )
-                future_tables = executor.submit(
-                    extract_tables_from_documents,
-                    file_paths,
-                    model_name,
-                    fields_and_tables["tables"],
-                )
-                
-                fields_df = future_fields.result()
-                tables_df = future_tables.result()
-        
-        # Extract only fields if tables not needed
-        elif extract_fields:
-            logger.debug("Extracting fields only")
-            fields_df = extract_fields_from_documents(
-                file_paths,
+        fields_df, tables_df = _run(
+            _aextract_fields_and_tables(
+                images,
                 model_name,
-                fields_and_tables["fields"],
-            )
-        
-        # Extract only tables if fields not needed
-        elif extract_tables:
-            logger.debug("Extracting tables only")
-            tables_df = extract_tables_from_documents(
-                file_paths,
-                model_name,
-                fields_and_tables["tables"],
+                fields_and_tables,
+                extract_fields,
+                extract_tables,
+                batch_size,
             )
+        )
         
         # Post-process results
-        if not fields_df.empty and 'document_index' in fields_df.columns:
-            fields_df = fields_df.sort_values(['document_index', 'fields'])
+        if not fields_df.empty:
             logger.debug(f"Extracted {len(fields_df)} field records")
         
         if not tables_df.empty:
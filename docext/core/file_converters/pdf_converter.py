@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import io
 import os
-import tempfile
+import uuid
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 from pdf2image import convert_from_path
+from PIL import Image
 
 from docext.core.file_converters.file_converter import FileConverter
+from docext.core.resource_manager import resource_manager
+
+
+def _rasterize_thread_count() -> int:
+    """Number of poppler workers to shard PDF pages across."""
+    return min(os.cpu_count() or 4, 8)
 
 
 class PDFConverter(FileConverter):
@@ -38,20 +46,70 @@ class PDFConverter(FileConverter):
             
         try:
             logger.debug(f"Converting PDF to images: {file_path}")
-            images = convert_from_path(file_path)
+            # pdftoppm streams raw PPM over stdout, so the in-memory path
+            # skips any encode/decode; pages are split across workers.
+            images = convert_from_path(file_path, thread_count=_rasterize_thread_count())
             logger.debug(f"Successfully converted PDF to {len(images)} images")
             return images
         except Exception as e:
             logger.error(f"Failed to convert PDF {file_path}: {str(e)}")
             raise
 
-    def convert_and_save_images(self, file_path: str, output_folder: str | None = None):
+    def convert_to_bytes(
+        self,
+        file_path: str,
+        fmt: str = "JPEG",
+        quality: int = 95,
+        max_img_size: int | None = None,
+        **save_options,
+    ) -> list[bytes]:
+        """
+        Convert PDF file to encoded image bytes without touching the disk.
+        
+        Args:
+            file_path: Path to the PDF file
+            fmt: PIL format used to encode each page
+            quality: Encoder quality
+            max_img_size: If set, pages are downscaled so the larger side fits
+            **save_options: Extra encoder options passed to `Image.save`
+            
+        Returns:
+            List of encoded images, one per page
+            
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            Exception: If PDF conversion fails
+        """
+        encoded_pages = []
+        for image in self.convert_to_images(file_path):
+            if max_img_size and max(image.size) > max_img_size:
+                image.thumbnail((max_img_size, max_img_size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, fmt, quality=quality, **save_options)
+            encoded_pages.append(buffer.getvalue())
+        logger.debug(f"Encoded {len(encoded_pages)} pages of {file_path} in memory")
+        return encoded_pages
+
+    def convert_and_save_images(
+        self,
+        file_path: str,
+        output_folder: str | None = None,
+        fmt: str = "png",
+        jpegopt: dict | None = None,
+        thread_count: int | None = None,
+    ):
         """
         Convert PDF to images and save them to disk.
         
         Args:
             file_path: Path to the PDF file
-            output_folder: Directory to save images. If None, uses system temp directory
+            output_folder: Directory to save images. If None, a unique temporary
+                directory is created, which is removed by
+                `resource_manager.cleanup_all()` or at interpreter exit
+            fmt: Image format poppler writes ("png" or "jpeg")
+            jpegopt: Optional poppler JPEG options, e.g. {"quality": 95}
+            thread_count: Number of poppler processes to use. Defaults to one
+                per core, capped at 8
             
         Returns:
             List of paths to saved image files
@@ -61,37 +119,51 @@ class PDFConverter(FileConverter):
             OSError: If output directory cannot be created
             Exception: If conversion or saving fails
         """
-        images = self.convert_to_images(file_path)
-        
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"PDF file not found: {file_path}")
+
+        pdf_name = Path(file_path).stem
         if not output_folder:
             # Create a unique subdirectory in temp folder to avoid conflicts
-            pdf_name = Path(file_path).stem
-            output_folder = os.path.join(tempfile.gettempdir(), f"docext_pdf_{pdf_name}")
+            output_folder = str(
+                resource_manager.create_temp_directory(
+                    prefix=f"docext_pdf_{pdf_name}_", cleanup_at_exit=True
+                )
+            )
             
         try:
             os.makedirs(output_folder, exist_ok=True)
-            logger.debug(f"Saving {len(images)} images to: {output_folder}")
+            logger.debug(f"Saving pages of {file_path} to: {output_folder}")
         except OSError as e:
             logger.error(f"Failed to create output directory {output_folder}: {str(e)}")
             raise
             
-        output_file_paths = []
-        
-        for i, image in enumerate(images):
-            try:
-                output_file_path = os.path.join(output_folder, f"page_{i}.png")
-                image.save(output_file_path, "PNG", optimize=True)
-                output_file_paths.append(output_file_path)
-                logger.debug(f"Saved page {i+1} to: {output_file_path}")
-            except Exception as e:
-                logger.error(f"Failed to save page {i+1}: {str(e)}")
-                # Clean up partially saved files
-                for saved_path in output_file_paths:
+        # Let poppler write the images itself instead of round-tripping every
+        # page through PIL. The unique prefix keeps pages from earlier runs
+        # on the same file from being picked up.
+        output_prefix = f"{pdf_name}_{uuid.uuid4().hex[:8]}_"
+        try:
+            output_file_paths = convert_from_path(
+                file_path,
+                output_folder=output_folder,
+                output_file=output_prefix,
+                fmt=fmt,
+                jpegopt=jpegopt or {},
+                paths_only=True,
+                use_pdftocairo=True,
+                thread_count=thread_count or _rasterize_thread_count(),
+            )
+        except Exception as e:
+            logger.error(f"Failed to convert PDF {file_path}: {str(e)}")
+            # Clean up partially saved files
+            for name in os.listdir(output_folder):
+                if name.startswith(output_prefix):
                     try:
-                        os.remove(saved_path)
+                        os.remove(os.path.join(output_folder, name))
                     except OSError:
                         pass
-                raise
+            raise
                 
         logger.info(f"Successfully converted PDF to {len(output_file_paths)} images in {output_folder}")
         return output_file_paths
+
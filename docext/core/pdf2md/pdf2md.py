@@ -1,17 +1,34 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
 from collections.abc import Generator
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from docext.core.config import config
+from docext.core.resource_manager import resource_manager
 from docext.core.utils import convert_files_to_images
 from docext.core.utils import encode_image
 from docext.core.utils import resize_images
 from docext.core.utils import validate_file_paths
 
+# Pages of a document are streamed one after another against the same server,
+# so keep the connection alive between them rather than reconnecting per page.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+atexit.register(_SESSION.close)
+
 
 def stream_request(
     messages: list[dict],
@@ -60,7 +77,7 @@ def stream_request(
     url = f"{vlm_url}/chat/completions"
 
     try:
-        with requests.post(url, json=payload, headers=headers, stream=True) as response:
+        with _SESSION.post(url, json=payload, headers=headers, stream=True) as response:
             response.raise_for_status()
 
             for line in response.iter_lines():
@@ -97,87 +114,98 @@ def convert_to_markdown_stream(
         for file_input in file_inputs
     ]
     validate_file_paths(file_paths)
+    input_paths = set(file_paths)
     file_paths = convert_files_to_images(file_paths)
-    resize_images(file_paths, max_img_size)
+    try:
+        resize_images(file_paths, max_img_size)
 
-    # Create system prompt for PDF to markdown conversion
-    user_prompt = """Extract the text from the above document as if you were reading it naturally. Return the tables in html format. Watermarks should be wrapped in brackets. Ex: <watermark>OFFICIAL COPY</watermark>. Page numbers should be wrapped in brackets. Ex: <page_number>14</page_number> or <page_number>9/22</page_number>. Prefer using ☐ and ☑ for check boxes. Some documents are handwritten or signed. Signatures are very rare, so before labeling a handwriting as a signature, make sure that it is 100/percent/ signature, and if not, read the handwriting with absolute accuracy."""
+        # Create system prompt for PDF to markdown conversion
+        user_prompt = """Extract the text from the above document as if you were reading it naturally. Return the tables in html format. Watermarks should be wrapped in brackets. Ex: <watermark>OFFICIAL COPY</watermark>. Page numbers should be wrapped in brackets. Ex: <page_number>14</page_number> or <page_number>9/22</page_number>. Prefer using ☐ and ☑ for check boxes. Some documents are handwritten or signed. Signatures are very rare, so before labeling a handwriting as a signature, make sure that it is 100/percent/ signature, and if not, read the handwriting with absolute accuracy."""
 
-    logger.info(
-        f"Converting {len(file_paths)} image(s) to markdown using {model_name} (processing one by one)"
-    )
+        logger.info(
+            f"Converting {len(file_paths)} image(s) to markdown using {model_name} (processing one by one)"
+        )
 
-    # Accumulate results from all pages
-    full_markdown_content = ""
+        # Accumulate results from all pages
+        full_markdown_content = ""
 
-    # Process each image individually
-    for i, file_path in enumerate(file_paths):
-        logger.info(f"Processing page {i + 1} of {len(file_paths)}: {file_path}")
+        # Process each image individually
+        for i, file_path in enumerate(file_paths):
+            logger.info(f"Processing page {i + 1} of {len(file_paths)}: {file_path}")
 
-        # Build messages for this single image
-        content = [
-            {
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/jpeg;base64,{encode_image(file_path)}"
+            # Build messages for this single image
+            content = [
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:image/jpeg;base64,{encode_image(file_path)}"
+                    },
                 },
-            },
-            {"type": "text", "text": user_prompt},
-        ]
-
-        messages = [{"role": "user", "content": content}]
-
-        # Stream this individual page
-        page_content = ""
-        try:
-            for chunk in stream_request(
-                messages=messages,
-                model_name=model_name,
-                max_tokens=max_gen_tokens,
-            ):
-                page_content += chunk
-                # Yield accumulated content from all pages processed so far + current page
-                current_total = (
-                    full_markdown_content
-                    + f"Page {i + 1} of {len(file_paths)}\n"
-                    + page_content
-                )
-                yield current_total
-
-            # Process the completed page content and add it to the full content
-            full_markdown_content += (
-                f"Page {i + 1} of {len(file_paths)}\n" + page_content
-            )
-            logger.info(f"Successfully converted page {i + 1}")
-
-        except Exception as e:
-            logger.error(f"Error during streaming conversion of page {i + 1}: {e}")
-            # Fallback to non-streaming for this page
-            logger.info(f"Falling back to non-streaming request for page {i + 1}")
-            try:
-                from docext.core.client import sync_request
+                {"type": "text", "text": user_prompt},
+            ]
 
-                response = sync_request(
-                    messages=messages, model_name=model_name, max_tokens=max_gen_tokens
-                )
-                page_content = response["choices"][0]["message"]["content"]
+            messages = [{"role": "user", "content": content}]
+
+            # Stream this individual page
+            page_content = ""
+            try:
+                for chunk in stream_request(
+                    messages=messages,
+                    model_name=model_name,
+                    max_tokens=max_gen_tokens,
+                ):
+                    page_content += chunk
+                    # Yield accumulated content from all pages processed so far + current page
+                    current_total = (
+                        full_markdown_content
+                        + f"Page {i + 1} of {len(file_paths)}\n"
+                        + page_content
+                    )
+                    yield current_total
+
+                # Process the completed page content and add it to the full content
                 full_markdown_content += (
                     f"Page {i + 1} of {len(file_paths)}\n" + page_content
                 )
-                yield full_markdown_content
-            except Exception as fallback_error:
-                logger.error(f"Fallback also failed for page {i + 1}: {fallback_error}")
-                error_content = (
-                    f"\n\n**Error processing page {i + 1}: {str(fallback_error)}**\n\n"
-                )
-                full_markdown_content += (
-                    f"Page {i + 1} of {len(file_paths)}\n" + error_content
-                )
-                yield full_markdown_content
-
-    # print raw model response
-    logger.info(f"Raw model response:\n {full_markdown_content}")
-    logger.info("Successfully completed document conversion")
+                logger.info(f"Successfully converted page {i + 1}")
+
+            except Exception as e:
+                logger.error(f"Error during streaming conversion of page {i + 1}: {e}")
+                # Fallback to non-streaming for this page
+                logger.info(f"Falling back to non-streaming request for page {i + 1}")
+                try:
+                    from docext.core.client import sync_request
+
+                    response = sync_request(
+                        messages=messages,
+                        model_name=model_name,
+                        max_tokens=max_gen_tokens,
+                    )
+                    page_content = response["choices"][0]["message"]["content"]
+                    full_markdown_content += (
+                        f"Page {i + 1} of {len(file_paths)}\n" + page_content
+                    )
+                    yield full_markdown_content
+                except Exception as fallback_error:
+                    logger.error(
+                        f"Fallback also failed for page {i + 1}: {fallback_error}"
+                    )
+                    error_content = f"\n\n**Error processing page {i + 1}: {str(fallback_error)}**\n\n"
+                    full_markdown_content += (
+                        f"Page {i + 1} of {len(file_paths)}\n" + error_content
+                    )
+                    yield full_markdown_content
+
+        # print raw model response
+        logger.info(f"Raw model response:\n {full_markdown_content}")
+        logger.info("Successfully completed document conversion")
+    finally:
+        # Pages rendered from PDFs are written next to the input; remove them
+        # once the document is done rather than at process exit
+        if config.get("CLEANUP_TEMP_FILES", True):
+            for file_path in file_paths:
+                if file_path not in input_paths:
+                    resource_manager.cleanup_resource(file_path)
 
 
 def convert_to_markdown(
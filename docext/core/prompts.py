@@ -4,6 +4,14 @@ import pandas as pd
 from PIL import Image
 
 from docext.core.utils import encode_image
+from docext.core.utils import encode_image_bytes
+
+
+def _image_base64(image: str | bytes) -> str:
+    """Base64 for an image given either as a file path or as encoded bytes."""
+    if isinstance(image, bytes):
+        return encode_image_bytes(image)
+    return encode_image(image)
 
 
 def _get_name_desc_prompt(fields: list[str], fields_description: list[str]) -> str:
@@ -22,7 +30,7 @@ def _get_fields_output_format(fields: list[str]) -> dict:
 def get_fields_messages(
     fields: list[str],
     fields_description: list[str],
-    filepaths: list[str],
+    filepaths: list[str | bytes],
 ) -> list[dict]:
     messages = [
         {
@@ -37,7 +45,7 @@ def get_fields_messages(
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/jpeg;base64,{encode_image(filepath)}",
+                            "url": f"data:image/jpeg;base64,{_image_base64(filepath)}",
                         },
                     }
                     for filepath in filepaths
@@ -52,6 +60,43 @@ def get_fields_messages(
     return messages
 
 
+def get_fields_messages_batched(
+    fields: list[str],
+    fields_description: list[str],
+    filepaths: list[str | bytes],
+) -> list[dict]:
+    """Like `get_fields_messages`, but every image is a separate document."""
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Extract the following fields from each of the documents:\n {_get_name_desc_prompt(fields, fields_description)}.",
+                },
+                *[
+                    part
+                    for i, filepath in enumerate(filepaths)
+                    for part in (
+                        {"type": "text", "text": f"Document {i + 1}:\n"},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{_image_base64(filepath)}",
+                            },
+                        },
+                    )
+                ],
+                {
+                    "type": "text",
+                    "text": f"Return a JSON list with one object per document, in the order the documents are given. Each object must have the following format:\n {_get_fields_output_format(fields)}. If a field is not found, return '' for that field. Do not give any explanation.",
+                },
+            ],
+        },
+    ]
+    return messages
+
+
 def _get_tables_output_format(columns: list[str]) -> str:
     return pd.DataFrame({col: [".."] for col in columns}).to_markdown(index=False)
 
@@ -59,7 +104,7 @@ def _get_tables_output_format(columns: list[str]) -> str:
 def get_tables_messages(
     columns_names: list[str],
     columns_description: list[str],
-    filepaths: list[str],
+    filepaths: list[str | bytes],
 ) -> list[dict]:
     messages = [
         {
@@ -74,7 +119,7 @@ def get_tables_messages(
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/jpeg;base64,{encode_image(filepath)}",
+                            "url": f"data:image/jpeg;base64,{_image_base64(filepath)}",
                         },
                     }
                     for filepath in filepaths
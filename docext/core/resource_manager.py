@@ -11,42 +11,91 @@ from __future__ import annotations
 
 import os
 import shutil
+import subprocess
+import sys
 import tempfile
 import atexit
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Optional, Union
+from typing import Iterable, List, Set, Optional, Union
 from contextlib import contextmanager
 from loguru import logger
 
 from .config import config
 
+# Directories with more direct entries than this are handed to the OS's own
+# recursive delete, which has no per-entry interpreter overhead
+_LARGE_TREE_ENTRIES = 1000
+# Fewer tracked resources than this are not worth starting threads for
+_PARALLEL_CLEANUP_MIN_RESOURCES = 4
+
+
+def _remove_directory(path: Union[str, Path]):
+    """Remove a directory tree, shelling out to rm/rd for large trees."""
+    with os.scandir(path) as entries:
+        num_probed = sum(1 for _ in itertools.islice(entries, _LARGE_TREE_ENTRIES + 1))
+    is_large = num_probed > _LARGE_TREE_ENTRIES
+    
+    if is_large:
+        if os.name == "posix":
+            command = ["rm", "-rf", "--", str(path)]
+        else:
+            command = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+        subprocess.run(command, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if not os.path.lexists(path):
+            return
+        logger.debug(f"Native delete left {path} behind, retrying with shutil")
+    
+    shutil.rmtree(path)
+
 
 class ResourceManager:
-    """Manages temporary files and directories with automatic cleanup."""
+    """
+    Manages temporary files and directories with automatic cleanup.
+    
+    Tracked resources are removed by an explicit `cleanup_all()` call. Long
+    running processes should prefer the `temp_directory` and `temp_file`
+    context managers, which clean up as soon as the block exits. Directories
+    and resources tracked with `cleanup_at_exit=True` (such as the ones
+    `PDFConverter.convert_and_save_images` makes when given no output folder
+    and the page images `convert_files_to_images` writes) are always removed at interpreter exit; cleaning up everything else at
+    exit is opt-in via DOCEXT_ATEXIT_CLEANUP=true, since other threads may
+    still hold those files open during shutdown.
+    """
     
     def __init__(self):
         """Initialize the resource manager."""
         self._tracked_resources: Set[Path] = set()
+        self._exit_resources: Set[Path] = set()
         self._cleanup_enabled = config.get('CLEANUP_TEMP_FILES', True)
+        self._cleanup_all_at_exit = config.get('ATEXIT_CLEANUP', False)
         
         # Register cleanup function to run on exit
-        atexit.register(self.cleanup_all)
+        atexit.register(self._cleanup_at_exit)
         
         logger.debug("Resource manager initialized")
     
-    def create_temp_directory(self, prefix: str = "docext_", suffix: str = "") -> Path:
+    def create_temp_directory(
+        self, prefix: str = "docext_", suffix: str = "", cleanup_at_exit: bool = False
+    ) -> Path:
         """
         Create a temporary directory and track it for cleanup.
         
         Args:
             prefix: Prefix for the directory name
             suffix: Suffix for the directory name
+            cleanup_at_exit: Also remove the directory at interpreter exit if
+                it is still around, for directories handed to callers that
+                have no other way to clean them up
             
         Returns:
             Path: Path to the created temporary directory
         """
         temp_dir = Path(tempfile.mkdtemp(prefix=prefix, suffix=suffix))
         self._tracked_resources.add(temp_dir)
+        if cleanup_at_exit:
+            self._exit_resources.add(temp_dir)
         logger.debug(f"Created temporary directory: {temp_dir}")
         return temp_dir
     
@@ -94,6 +143,27 @@ class ResourceManager:
         logger.debug(f"Tracking resource: {path}")
         return path
     
+    def track_resources(
+        self, resource_paths: Iterable[Union[str, Path]], cleanup_at_exit: bool = False
+    ) -> List[Path]:
+        """
+        Track several existing resources for cleanup at once.
+        
+        Args:
+            resource_paths: Paths to the resources to track
+            cleanup_at_exit: Also remove the resources at interpreter exit if
+                they are still around, see `create_temp_directory`
+            
+        Returns:
+            List[Path]: Path objects of the tracked resources
+        """
+        paths = [Path(resource_path) for resource_path in resource_paths]
+        self._tracked_resources.update(paths)
+        if cleanup_at_exit:
+            self._exit_resources.update(paths)
+        logger.debug(f"Tracking {len(paths)} resources")
+        return paths
+    
     def untrack_resource(self, resource_path: Union[str, Path]) -> bool:
         """
         Stop tracking a resource (without deleting it).
@@ -115,38 +185,50 @@ class ResourceManager:
         """
         Clean up a specific resource.
         
+        The path is not stat-ed up front: a file is removed with a single
+        unlink, a directory only costs an extra check once the unlink fails,
+        and a resource that is already gone counts as cleaned up.
+        
         Args:
             resource_path: Path to the resource to clean up
             
         Returns:
-            bool: True if cleanup was successful, False otherwise
+            bool: True if cleanup was successful, False otherwise (e.g. on a
+                permission error, which is logged)
         """
         path = Path(resource_path)
         
         try:
-            if path.exists():
-                if path.is_file():
-                    path.unlink()
-                    logger.debug(f"Deleted file: {path}")
-                elif path.is_dir():
-                    shutil.rmtree(path)
-                    logger.debug(f"Deleted directory: {path}")
-                else:
-                    logger.warning(f"Unknown resource type: {path}")
-                    return False
+            # Try the common case first instead of stat-ing the path up front
+            try:
+                os.unlink(path)
+                logger.debug(f"Deleted file: {path}")
+            except FileNotFoundError:
+                pass
+            except (IsADirectoryError, PermissionError):
+                # Linux reports EISDIR for directories, macOS reports EPERM
+                if not path.is_dir():
+                    raise
+                _remove_directory(path)
+                logger.debug(f"Deleted directory: {path}")
             
             # Remove from tracking
             self._tracked_resources.discard(path)
+            self._exit_resources.discard(path)
             return True
             
         except Exception as e:
             logger.error(f"Failed to cleanup resource {path}: {e}")
             return False
     
-    def cleanup_all(self) -> int:
+    def cleanup_all(self, parallel: bool = True) -> int:
         """
         Clean up all tracked resources.
         
+        Args:
+            parallel: Delete on a thread pool when there are enough resources
+                to make it worthwhile
+            
         Returns:
             int: Number of resources successfully cleaned up
         """
@@ -154,16 +236,35 @@ class ResourceManager:
             logger.debug("Resource cleanup is disabled")
             return 0
         
-        cleaned_count = 0
         resources_to_clean = list(self._tracked_resources)  # Copy to avoid modification during iteration
+        if not resources_to_clean:
+            return 0
         
-        for resource in resources_to_clean:
-            if self.cleanup_resource(resource):
-                cleaned_count += 1
+        if (
+            not parallel
+            or sys.is_finalizing()
+            or len(resources_to_clean) < _PARALLEL_CLEANUP_MIN_RESOURCES
+        ):
+            cleaned_count = sum(map(self.cleanup_resource, resources_to_clean))
+        else:
+            # Deletion is syscall bound, so a few threads overlap the I/O waits
+            with ThreadPoolExecutor(max_workers=min(8, len(resources_to_clean))) as executor:
+                cleaned_count = sum(executor.map(self.cleanup_resource, resources_to_clean))
         
         logger.info(f"Cleaned up {cleaned_count} resources")
         return cleaned_count
     
+    def _cleanup_at_exit(self):
+        """Remove resources that must not outlive the interpreter."""
+        # Thread pools can't take new work once the interpreter is shutting
+        # down, so exit-time cleanup runs serially
+        if self._cleanup_all_at_exit:
+            self.cleanup_all(parallel=False)
+        elif self._cleanup_enabled:
+            for resource in list(self._exit_resources):
+                if resource in self._tracked_resources:
+                    self.cleanup_resource(resource)
+    
     def list_tracked_resources(self) -> List[Path]:
         """
         Get a list of all tracked resources.
@@ -244,6 +345,21 @@ def get_temp_dir() -> Path:
     return temp_dir
 
 
+def _fast_rmtree(path: str):
+    """
+    Remove a directory tree using the file types `os.scandir` already knows.
+    
+    Symlinks are unlinked, never followed.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 def cleanup_old_temp_files(max_age_hours: int = 24) -> int:
     """
     Clean up old temporary files created by DocExt.
@@ -262,19 +378,22 @@ def cleanup_old_temp_files(max_age_hours: int = 24) -> int:
     cleaned_count = 0
     
     try:
-        for item in temp_dir.iterdir():
-            if item.name.startswith("docext_"):
-                item_age = current_time - item.stat().st_mtime
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith("docext_"):
+                    continue
+                # DirEntry caches the lstat result, so the entry is stat-ed once
+                item_age = current_time - entry.stat(follow_symlinks=False).st_mtime
                 if item_age > max_age_seconds:
                     try:
-                        if item.is_file():
-                            item.unlink()
-                        elif item.is_dir():
-                            shutil.rmtree(item)
+                        if entry.is_dir(follow_symlinks=False):
+                            _fast_rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
                         cleaned_count += 1
-                        logger.debug(f"Cleaned up old temp resource: {item}")
+                        logger.debug(f"Cleaned up old temp resource: {entry.path}")
                     except Exception as e:
-                        logger.error(f"Failed to cleanup old temp resource {item}: {e}")
+                        logger.error(f"Failed to cleanup old temp resource {entry.path}: {e}")
         
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} old temporary files")
@@ -10,19 +10,99 @@ This module provides common utilities including:
 
 from __future__ import annotations
 
-import base64
 import io
+import mmap
 import os
-from typing import Union, List, Dict, Any
+import stat
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from functools import lru_cache
+from functools import partial
+from typing import TYPE_CHECKING, Union, List, Dict, Any
 from pathlib import Path
 
-import pandas as pd
+import PIL
 from PIL import Image
 from loguru import logger
 
+try:
+    # SIMD accelerated, byte-for-byte identical output
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # pyvips is optional and also fails to import without libvips installed
+    pyvips = None
+
+from docext.core.config import Field
+from docext.core.config import as_fields
+from docext.core.config import config
 from docext.core.file_converters.pdf_converter import PDFConverter
 from docext.core.resource_manager import resource_manager
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+_IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".tiff", ".bmp", ".gif", ".webp"}
+)
+_SUPPORTED_EXTENSIONS = _IMAGE_EXTENSIONS | {".pdf"}
+_IMAGE_SUFFIXES = tuple(_IMAGE_EXTENSIONS)
+
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+# Pillow-SIMD is a drop-in replacement for Pillow with SSE4/AVX2 resampling
+# kernels; its releases carry a ".postN" version suffix.
+if ".post" in PIL.__version__:
+    logger.debug(f"Using Pillow-SIMD {PIL.__version__} for image resizing")
+else:
+    logger.debug(
+        f"Using Pillow {PIL.__version__}; install pillow-simd for faster image resizing"
+    )
+
+
+def _jpeg_save_options() -> Dict[str, Any]:
+    """PIL JPEG encoder settings for page images sent to the model."""
+    # 4:2:0 chroma subsampling and a quality of 85 roughly halve the bytes of
+    # a scanned page without hurting text legibility
+    return {
+        "quality": config.get("JPEG_QUALITY", 85),
+        "subsampling": 2,
+        "progressive": True,
+        "optimize": True,
+    }
+
+
+def encode_image_bytes(image: bytes) -> str:
+    """
+    Encode in-memory image bytes to a base64 string.
+    
+    Args:
+        image: Encoded image bytes
+        
+    Returns:
+        str: Base64 encoded image string
+    """
+    return b64encode(image).decode("ascii")
+
+
+def _open_for_reading(path: str) -> int:
+    """Open a file descriptor for reading without updating its access time."""
+    flags = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    noatime = getattr(os, "O_NOATIME", 0)
+    if noatime:
+        try:
+            return os.open(path, flags | noatime)
+        except PermissionError:
+            # O_NOATIME is only allowed on files the process owns
+            pass
+    return os.open(path, flags)
+
 
 def encode_image(image_path: Union[str, Path]) -> str:
     """
@@ -39,22 +119,59 @@ def encode_image(image_path: Union[str, Path]) -> str:
         Exception: If encoding fails
     """
     try:
-        image_path = Path(image_path)
+        try:
+            fd = _open_for_reading(os.fspath(image_path))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image file not found: {image_path}") from None
         
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
+        try:
+            try:
+                # Encode straight from the page cache instead of copying the
+                # file into a bytes object first
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    encoded = b64encode(mapped)
+            except (ValueError, OSError):
+                # Empty files and some file systems can't be mapped; encode
+                # chunk by chunk, a multiple of 3 bytes never needs padding
+                encoded = bytearray()
+                with open(fd, "rb", closefd=False) as image_file:
+                    while chunk := image_file.read(_B64_CHUNK_SIZE):
+                        encoded += b64encode(chunk)
+        finally:
+            os.close(fd)
         
-        with open(image_path, "rb") as image_file:
-            encoded = base64.b64encode(image_file.read()).decode("utf-8")
-            logger.debug(f"Encoded image: {image_path}")
-            return encoded
+        logger.debug(f"Encoded image: {image_path}")
+        return encoded.decode("ascii")
             
     except Exception as e:
         logger.error(f"Failed to encode image {image_path}: {e}")
         raise
 
 
-def validate_fields_and_tables(fields_and_tables: Union[Dict[str, Any], pd.DataFrame]) -> Dict[str, List[Dict]]:
+def _fields_and_tables_from_df(df: pd.DataFrame) -> Dict[str, List[Field]]:
+    """Split a fields/tables DataFrame (e.g. from the UI) into `Field` records."""
+    if "name" not in df.columns:
+        raise ValueError("DataFrame must have a 'name' column")
+    if not df["name"].notna().all():
+        raise ValueError("Every row must have a 'name'")
+    
+    # Read whole columns instead of building a dict per row; any other
+    # column (such as the UI's 'index') is simply never looked at
+    names = df["name"].tolist()
+    types = df["type"].tolist()
+    if "description" in df.columns:
+        descriptions = df["description"].tolist()
+    else:
+        descriptions = [""] * len(names)
+    
+    records: Dict[str, List[Field]] = {"fields": [], "tables": []}
+    for name, description, type_ in zip(names, descriptions, types):
+        if type_ in ("field", "table"):
+            records[f"{type_}s"].append(Field(name, description, type_))
+    return records
+
+
+def validate_fields_and_tables(fields_and_tables: Union[Dict[str, Any], pd.DataFrame]) -> Dict[str, List[Field]]:
     """
     Validate and normalize fields and tables configuration.
     
@@ -62,24 +179,19 @@ def validate_fields_and_tables(fields_and_tables: Union[Dict[str, Any], pd.DataF
         fields_and_tables: Configuration dict or DataFrame
         
     Returns:
-        dict: Normalized configuration with 'fields' and 'tables' keys
+        dict: Normalized configuration with 'fields' and 'tables' keys,
+            each a list of `Field` records
         
     Raises:
         ValueError: If validation fails
     """
     try:
         # Convert DataFrame to dict if needed
-        if isinstance(fields_and_tables, pd.DataFrame):
-            if "index" in fields_and_tables.columns:
-                fields_and_tables.drop(columns=["index"], inplace=True)
-            
-            fields_df = fields_and_tables[fields_and_tables.type == "field"]
-            tables_df = fields_and_tables[fields_and_tables.type == "table"]
-
-            fields_and_tables = {
-                "fields": fields_df.to_dict(orient="records"),
-                "tables": tables_df.to_dict(orient="records"),
-            }
+        # pandas is only needed for DataFrame input, and a DataFrame can only
+        # exist once pandas has been imported by the caller
+        pd = sys.modules.get("pandas")
+        if pd is not None and isinstance(fields_and_tables, pd.DataFrame):
+            fields_and_tables = _fields_and_tables_from_df(fields_and_tables)
 
         # Validate structure
         if not isinstance(fields_and_tables, dict):
@@ -91,22 +203,30 @@ def validate_fields_and_tables(fields_and_tables: Union[Dict[str, Any], pd.DataF
         if "tables" not in fields_and_tables:
             raise ValueError("'tables' key must be present in configuration")
 
-        # Validate field entries
-        for i, field_details in enumerate(fields_and_tables["fields"]):
-            if not isinstance(field_details, dict):
-                raise ValueError(f"Field {i} must be a dictionary")
-            if "name" not in field_details:
-                raise ValueError(f"Field {i} must have a 'name' key")
-
-        # Validate table entries
-        for i, table_details in enumerate(fields_and_tables["tables"]):
-            if not isinstance(table_details, dict):
-                raise ValueError(f"Table {i} must be a dictionary")
-            if "name" not in table_details:
-                raise ValueError(f"Table {i} must have a 'name' key")
-
-        logger.debug(f"Validated configuration: {len(fields_and_tables['fields'])} fields, {len(fields_and_tables['tables'])} tables")
-        return fields_and_tables
+        # Validate field and table entries
+        for key, label in (("fields", "Field"), ("tables", "Table")):
+            entries = fields_and_tables[key]
+            bad = next(
+                (
+                    i
+                    for i, details in enumerate(entries)
+                    if not isinstance(details, Field)
+                    and not (isinstance(details, dict) and "name" in details)
+                ),
+                None,
+            )
+            if bad is not None:
+                if not isinstance(entries[bad], dict):
+                    raise ValueError(f"{label} {bad} must be a dictionary")
+                raise ValueError(f"{label} {bad} must have a 'name' key")
+
+        normalized = {
+            "fields": as_fields(fields_and_tables["fields"], "field"),
+            "tables": as_fields(fields_and_tables["tables"], "table"),
+        }
+
+        logger.debug(f"Validated configuration: {len(normalized['fields'])} fields, {len(normalized['tables'])} tables")
+        return normalized
         
     except Exception as e:
         logger.error(f"Failed to validate fields and tables configuration: {e}")
@@ -117,6 +237,8 @@ def resize_images(file_paths: List[str], max_img_size: int) -> None:
     """
     Resize images to maximum size while maintaining aspect ratio.
     
+    Uses libvips when pyvips is installed and falls back to PIL otherwise.
+    
     Args:
         file_paths: List of image file paths
         max_img_size: Maximum size for the larger dimension
@@ -124,24 +246,83 @@ def resize_images(file_paths: List[str], max_img_size: int) -> None:
     Raises:
         Exception: If image processing fails
     """
-    for file_path in file_paths:
+    if not file_paths:
+        return
+    # Decoding, resampling and encoding all release the GIL
+    max_workers = min(32, (os.cpu_count() or 4) * 2, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(partial(_resize_one, max_img_size=max_img_size), file_paths))
+
+
+def _resize_one(file_path: str, max_img_size: int) -> None:
+    """Resize a single image in place, see `resize_images`."""
+    if pyvips is not None:
         try:
-            img = Image.open(file_path)
-            original_size = img.size
+            _resize_with_vips(file_path, max_img_size)
+            return
+        except pyvips.Error as e:
+            logger.debug(f"libvips could not resize {file_path}, falling back to PIL: {e}")
+
+    try:
+        img = Image.open(file_path)
+        original_size = img.size
+        
+        # Calculate new size maintaining aspect ratio
+        if max(original_size) > max_img_size:
+            ratio = max_img_size / max(original_size)
+            new_size = (int(original_size[0] * ratio), int(original_size[1] * ratio))
+            if img.format == "JPEG" and ratio < 0.5:
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale, never below
+                # the target size, so LANCZOS only finishes the job
+                img.draft(img.mode, new_size)
+            resized = img.resize(new_size, Image.Resampling.LANCZOS)
+            resized.save(file_path, **_jpeg_save_options())
+            logger.debug(f"Resized image {file_path}: {original_size} -> {new_size}")
+        else:
+            logger.debug(f"Image {file_path} already within size limit: {original_size}")
             
-            # Calculate new size maintaining aspect ratio
-            if max(original_size) > max_img_size:
-                ratio = max_img_size / max(original_size)
-                new_size = (int(original_size[0] * ratio), int(original_size[1] * ratio))
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
-                img.save(file_path, optimize=True, quality=95)
-                logger.debug(f"Resized image {file_path}: {original_size} -> {new_size}")
-            else:
-                logger.debug(f"Image {file_path} already within size limit: {original_size}")
-                
-        except Exception as e:
-            logger.error(f"Failed to resize image {file_path}: {e}")
-            raise
+    except Exception as e:
+        logger.error(f"Failed to resize image {file_path}: {e}")
+        raise
+
+
+def _resize_with_vips(file_path: str, max_img_size: int) -> None:
+    """
+    Resize an image in place with libvips.
+    
+    libvips only reads the header to decide whether a resize is needed and
+    shrinks JPEGs while decoding them, so oversized scans are never fully
+    decoded.
+    
+    Raises:
+        pyvips.Error: If libvips cannot read or write the image
+    """
+    header = pyvips.Image.new_from_file(file_path)
+    original_size = (header.width, header.height)
+    if max(original_size) <= max_img_size:
+        logger.debug(f"Image {file_path} already within size limit: {original_size}")
+        return
+
+    img = pyvips.Image.thumbnail(file_path, max_img_size, height=max_img_size, size="down")
+    root, ext = os.path.splitext(file_path)
+    tmp_path = f"{root}.tmp{ext}"
+    save_options = {}
+    if ext.lower() in (".jpg", ".jpeg"):
+        save_options = {
+            "Q": config.get("JPEG_QUALITY", 85),
+            "subsample_mode": "on",
+            "interlace": True,
+            "optimize_coding": True,
+            "strip": True,
+        }
+    try:
+        img.write_to_file(tmp_path, **save_options)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    logger.debug(f"Resized image {file_path}: {original_size} -> {(img.width, img.height)}")
 
 
 def validate_file_paths(file_paths: List[str]) -> None:
@@ -155,24 +336,24 @@ def validate_file_paths(file_paths: List[str]) -> None:
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is not supported
     """
-    supported_extensions = {
-        ".jpg", ".jpeg", ".png", ".tiff", ".bmp", ".gif", ".webp", ".pdf"
-    }
-    
     for file_path in file_paths:
-        path = Path(file_path)
+        # One stat answers both the exists and the is-file question
+        try:
+            exists, is_file = True, stat.S_ISREG(os.stat(file_path).st_mode)
+        except OSError:
+            exists = is_file = False
         
-        if not path.exists():
+        if not exists:
             raise FileNotFoundError(f"File does not exist: {file_path}")
         
-        if not path.is_file():
+        if not is_file:
             raise ValueError(f"Path is not a file: {file_path}")
         
-        extension = path.suffix.lower()
-        if extension not in supported_extensions:
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in _SUPPORTED_EXTENSIONS:
             raise ValueError(
                 f"Unsupported file format: {extension}. "
-                f"Supported formats: {', '.join(sorted(supported_extensions))}"
+                f"Supported formats: {', '.join(sorted(_SUPPORTED_EXTENSIONS))}"
             )
     
     logger.debug(f"Validated {len(file_paths)} file paths")
@@ -188,11 +369,24 @@ def file_is_supported_image(file_path: str) -> bool:
     Returns:
         bool: True if file is a supported image format
     """
-    supported_image_extensions = {
-        ".jpg", ".jpeg", ".png", ".tiff", ".bmp", ".gif", ".webp"
-    }
-    extension = Path(file_path).suffix.lower()
-    return extension in supported_image_extensions
+    return file_path.lower().endswith(_IMAGE_SUFFIXES)
+
+
+def _convert_one_pdf(file_path: str, thread_count: int) -> List[str]:
+    """Have poppler write the pages of one PDF as JPEGs next to the PDF."""
+    logger.debug(f"Converting PDF to images: {file_path}")
+    # poppler encodes the JPEGs itself, so pages never pass through PIL
+    return PDFConverter().convert_and_save_images(
+        file_path,
+        output_folder=os.path.dirname(file_path) or ".",
+        fmt="jpeg",
+        jpegopt={
+            "quality": config.get("JPEG_QUALITY", 85),
+            "progressive": True,
+            "optimize": True,
+        },
+        thread_count=thread_count,
+    )
 
 
 def convert_files_to_images(file_paths: List[str]) -> List[str]:
@@ -208,29 +402,104 @@ def convert_files_to_images(file_paths: List[str]) -> List[str]:
     Raises:
         Exception: If conversion fails
     """
+    pdf_paths = list(dict.fromkeys(
+        file_path for file_path in file_paths if file_path.lower().endswith(".pdf")
+    ))
+    pdf_pages = {}
+    if pdf_paths:
+        # Every conversion runs in poppler subprocesses, so a thread per PDF
+        # is enough to keep them all busy; the per-PDF process count is
+        # split so that together they roughly fill the cores
+        thread_count = max(1, (os.cpu_count() or 4) // len(pdf_paths))
+        with ThreadPoolExecutor(max_workers=min(len(pdf_paths), os.cpu_count() or 4)) as executor:
+            futures = {
+                file_path: executor.submit(_convert_one_pdf, file_path, thread_count)
+                for file_path in pdf_paths
+            }
+            # Let every conversion finish so that no worker is still writing
+            # pages once the pages get tracked
+            wait(futures.values())
+        
+        first_error = None
+        for file_path, future in futures.items():
+            try:
+                pdf_pages[file_path] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to convert file {file_path}: {e}")
+                first_error = first_error or e
+        
+        # Track the images of every successful conversion for cleanup in one
+        # go, even when another PDF failed. They sit next to the caller's PDFs,
+        # so they must not outlive the process either.
+        resource_manager.track_resources(
+            (
+                output_path
+                for output_paths in pdf_pages.values()
+                for output_path in output_paths
+            ),
+            cleanup_at_exit=True,
+        )
+        if first_error is not None:
+            raise first_error
+
     converted_file_paths = []
+    for file_path in file_paths:
+        if file_path in pdf_pages:
+            output_paths = pdf_pages[file_path]
+            converted_file_paths.extend(output_paths)
+            logger.info(f"Converted PDF to {len(output_paths)} images")
+        elif file_is_supported_image(file_path):
+            converted_file_paths.append(file_path)
+        else:
+            logger.warning(f"Skipping unsupported file: {file_path}")
+    
+    logger.debug(f"Converted {len(file_paths)} files to {len(converted_file_paths)} images")
+    return converted_file_paths
+
+
+def convert_files_to_image_bytes(file_paths: List[str], max_img_size: int) -> List[bytes]:
+    """
+    Load files as resized, encoded images kept in memory.
+    
+    In-memory counterpart of `convert_files_to_images` followed by
+    `resize_images`: PDF pages are never written to disk and input images are
+    not modified in place.
+    
+    Args:
+        file_paths: List of file paths to convert
+        max_img_size: Maximum size for the larger dimension
+        
+    Returns:
+        List[bytes]: Encoded images, one per image file or PDF page
+        
+    Raises:
+        Exception: If conversion fails
+    """
+    images: List[bytes] = []
     pdf_converter = PDFConverter()
     
     for file_path in file_paths:
         try:
-            path = Path(file_path)
-            
-            if path.suffix.lower() == ".pdf":
-                logger.debug(f"Converting PDF to images: {file_path}")
-                images = pdf_converter.convert_to_images(file_path)
-                
-                for i, image in enumerate(images):
-                    output_path = f"{file_path.replace('.pdf', '')}_{i}.jpg"
-                    image.save(output_path, optimize=True, quality=95)
-                    converted_file_paths.append(output_path)
-                    
-                    # Track the converted image for cleanup
-                    resource_manager.track_resource(output_path)
-                
-                logger.info(f"Converted PDF to {len(images)} images")
+            if file_path.lower().endswith(".pdf"):
+                pages = pdf_converter.convert_to_bytes(
+                    file_path,
+                    max_img_size=max_img_size,
+                    **_jpeg_save_options(),
+                )
+                images.extend(pages)
+                logger.info(f"Converted PDF to {len(pages)} in-memory images")
                 
             elif file_is_supported_image(file_path):
-                converted_file_paths.append(file_path)
+                with Image.open(file_path) as img:
+                    if max(img.size) <= max_img_size:
+                        with open(file_path, "rb") as image_file:
+                            images.append(image_file.read())
+                        continue
+                    page = img.convert("RGB")
+                    page.thumbnail((max_img_size, max_img_size), Image.Resampling.LANCZOS)
+                    buffer = io.BytesIO()
+                    page.save(buffer, "JPEG", **_jpeg_save_options())
+                    images.append(buffer.getvalue())
             else:
                 logger.warning(f"Skipping unsupported file: {file_path}")
                 
@@ -238,8 +507,63 @@ def convert_files_to_images(file_paths: List[str]) -> List[str]:
             logger.error(f"Failed to convert file {file_path}: {e}")
             raise
     
-    logger.debug(f"Converted {len(file_paths)} files to {len(converted_file_paths)} images")
-    return converted_file_paths
+    logger.debug(f"Converted {len(file_paths)} files to {len(images)} in-memory images")
+    return images
+
+
+_PNG_MODES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+_JPEG_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+# Start-of-frame markers; 0xC4 (DHT), 0xC8 (JPG) and 0xCC (DAC) share the range
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _fast_image_dims(file_path: str) -> tuple | None:
+    """
+    Read size, mode and format of an 8-bit PNG or JPEG from its header.
+    
+    Returns the same values `Image.open` reports, or None for anything else
+    (other formats, other bit depths, truncated or oversized headers) so the
+    caller can fall back to PIL.
+    """
+    with open(file_path, "rb") as image_file:
+        header = image_file.read(64 * 1024)
+
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", header[16:24])
+        bit_depth, color_type = header[24], header[25]
+        if bit_depth != 8 or color_type not in _PNG_MODES:
+            return None
+        return (width, height), _PNG_MODES[color_type], "PNG"
+
+    if header.startswith(b"\xff\xd8"):
+        offset = 2
+        while offset + 4 <= len(header):
+            if header[offset] != 0xFF:
+                return None
+            marker = header[offset + 1]
+            if marker == 0xFF:
+                # Fill byte before a marker
+                offset += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                # Standalone markers carry no length
+                offset += 2
+                continue
+            (length,) = struct.unpack(">H", header[offset + 2:offset + 4])
+            if marker == 0xE2 and header[offset + 4:offset + 8] == b"MPF\x00":
+                # Multi-picture JPEG, which PIL reports as "MPO"
+                return None
+            if marker in _JPEG_SOF_MARKERS:
+                if offset + 10 > len(header):
+                    return None
+                precision = header[offset + 4]
+                height, width = struct.unpack(">HH", header[offset + 5:offset + 9])
+                components = header[offset + 9]
+                if precision != 8 or components not in _JPEG_MODES:
+                    return None
+                return (width, height), _JPEG_MODES[components], "JPEG"
+            offset += 2 + length
+    return None
 
 
 def get_file_info(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -252,32 +576,48 @@ def get_file_info(file_path: Union[str, Path]) -> Dict[str, Any]:
     Returns:
         dict: File information including size, type, etc.
     """
-    path = Path(file_path)
-    
-    if not path.exists():
-        return {"exists": False, "path": str(path)}
+    path_str = os.fspath(file_path)
     
-    stat = path.stat()
+    try:
+        file_stat = os.stat(path_str)
+    except FileNotFoundError:
+        return {"exists": False, "path": path_str}
     
+    # Keyed on mtime and size, so a modified file is inspected again
+    return dict(
+        _get_file_info_cached(
+            path_str, file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_mtime
+        )
+    )
+
+
+@lru_cache(maxsize=4096)
+def _get_file_info_cached(
+    path_str: str, mtime_ns: int, size: int, mtime: float
+) -> Dict[str, Any]:
+    """Build the `get_file_info` result for one version of a file."""
+    name = os.path.basename(path_str)
+    extension = os.path.splitext(name)[1].lower()
     info = {
         "exists": True,
-        "path": str(path),
-        "name": path.name,
-        "size_bytes": stat.st_size,
-        "size_mb": round(stat.st_size / (1024 * 1024), 2),
-        "extension": path.suffix.lower(),
-        "is_image": file_is_supported_image(str(path)),
-        "is_pdf": path.suffix.lower() == ".pdf",
-        "modified_time": stat.st_mtime,
+        "path": path_str,
+        "name": name,
+        "size_bytes": size,
+        "size_mb": round(size / (1024 * 1024), 2),
+        "extension": extension,
+        "is_image": extension in _IMAGE_EXTENSIONS,
+        "is_pdf": extension == ".pdf",
+        "modified_time": mtime,
     }
     
     # Add image-specific info if it's an image
     if info["is_image"]:
         try:
-            with Image.open(path) as img:
-                info["image_size"] = img.size
-                info["image_mode"] = img.mode
-                info["image_format"] = img.format
+            header_info = _fast_image_dims(path_str)
+            if header_info is None:
+                with Image.open(path_str) as img:
+                    header_info = (img.size, img.mode, img.format)
+            info["image_size"], info["image_mode"], info["image_format"] = header_info
         except Exception:
             pass
     
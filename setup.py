@@ -28,6 +28,8 @@ setup(
     ],
     extras_require={
         "dev": ["pre-commit"],
+        "vips": ["pyvips"],
+        "fast-base64": ["pybase64"],
     },
     entry_points={
         "console_scripts": [
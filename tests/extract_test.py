@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+
+from docext.core.extract import _find_md_table
+from docext.core.extract import _md_table_to_df
+
+
+def _table_from_response(response: str):
+    table_md = _find_md_table(response)
+    assert table_md is not None
+    return _md_table_to_df(table_md)
+
+
+class FindMarkdownTableTest(unittest.TestCase):
+    def test_lf_response(self):
+        df = _table_from_response(
+            "Here is the table:\n| a | b |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\nDone."
+        )
+        self.assertEqual(list(df.columns), ["a", "b"])
+        self.assertEqual(df.values.tolist(), [["1", "2"], ["3", "4"]])
+
+    def test_crlf_response(self):
+        df = _table_from_response(
+            "Here is the table:\r\n| a | b |\r\n|---|---|\r\n| 1 | 2 |\r\n| 3 | 4 |\r\nDone."
+        )
+        self.assertEqual(list(df.columns), ["a", "b"])
+        self.assertEqual(df.values.tolist(), [["1", "2"], ["3", "4"]])
+
+    def test_blank_line_inside_table_keeps_later_rows(self):
+        df = _table_from_response("| a | b |\n|---|---|\n| 1 | 2 |\n\n| 3 | 4 |")
+        self.assertEqual(df.values.tolist(), [["1", "2"], ["3", "4"]])
+
+    def test_stray_line_inside_table_keeps_later_rows(self):
+        df = _table_from_response(
+            "| a | b |\n|---|---|\n| 1 | 2 |\n(continued)\n| 3 | 4 |\n"
+        )
+        self.assertEqual(df.values.tolist(), [["1", "2"], ["3", "4"]])
+
+    def test_no_table(self):
+        self.assertIsNone(_find_md_table("No table in this response."))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+from docext.core.utils import _fast_image_dims
+
+
+class FastImageDimsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _save(self, name, image, **save_options):
+        path = os.path.join(self.tmp_dir.name, name)
+        image.save(path, **save_options)
+        return path
+
+    def assertMatchesPil(self, path):
+        with Image.open(path) as img:
+            expected = (img.size, img.mode, img.format)
+        fast = _fast_image_dims(path)
+        if fast is not None:
+            self.assertEqual(fast, expected)
+        return fast
+
+    def test_png_parity(self):
+        for mode in ("L", "LA", "RGB", "RGBA"):
+            with self.subTest(mode=mode):
+                path = self._save(f"{mode}.png", Image.new(mode, (37, 19)))
+                self.assertIsNotNone(self.assertMatchesPil(path))
+
+    def test_jpeg_parity(self):
+        for mode, options in (
+            ("L", {"progressive": True}),
+            ("RGB", {"exif": b"Exif\x00\x00" + b"\x00" * 100}),
+            ("CMYK", {}),
+        ):
+            with self.subTest(mode=mode):
+                path = self._save(f"{mode}.jpg", Image.new(mode, (41, 23)), **options)
+                self.assertIsNotNone(self.assertMatchesPil(path))
+
+    def test_mpo_falls_back_to_pil(self):
+        frames = [Image.new("RGB", (29, 17), color) for color in ("red", "blue")]
+        path = self._save(
+            "multi.jpg",
+            frames[0],
+            format="MPO",
+            save_all=True,
+            append_images=frames[1:],
+        )
+        self.assertIsNone(self.assertMatchesPil(path))
+
+    def test_other_formats_fall_back_to_pil(self):
+        path = self._save("image.gif", Image.new("P", (8, 8)))
+        self.assertIsNone(_fast_image_dims(path))
+
+
+if __name__ == "__main__":
+    unittest.main()